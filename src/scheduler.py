@@ -18,6 +18,10 @@ it was outperforming my initial code by several orders of magnitude. I suspect t
 overestimated the complexity of the problem at hand. Looking at the problem more closely, I
 think it is probably O(n**3) instead of the O(2**n) I assumed at first.
 
+It turns out that once every mentor has a day and a time, placing the meetings into slots is
+an edge coloring of the bipartite mentor/company graph, which can be done without any search
+at all. The only thing left random is the choice of day and time for the unscheduled mentors.
+
 I opted to use Qt5 because it is the GUI framework I know best. Python is the easiest way to write
 Qt code, in my experience - C++ is too slow to prototype and the other language bindings aren't
 nearly as mature. I was initially going to make this a CLI program, but I decided that a simple
@@ -34,7 +38,7 @@ the program will require significantly less user input.
 '''
 
 from enum import Enum
-from random import randint, shuffle
+from random import randint
 import sys
 import csv
 
@@ -71,52 +75,112 @@ def is_valid(schedule):
             company_schedules[company].append((day, time))
     return True
 
+# Turn AM/PM and a slot offset to an actual time
+def deterministic_time(time, i):
+    if time == "AM":
+        return (9 + int(i/3), i%3*20)
+    else:
+        return (12 + int(i/3), i%3*20)
+
+SLOTS = 8
+
+def assign_slots(pairs, slots=SLOTS):
+    '''
+    Assigns a slot number to each mentor/company pair in a single (day, time) bucket,
+    such that no mentor and no company is given the same slot twice. This is an edge
+    coloring of the bipartite mentor/company graph, which by Konig's theorem always
+    exists with as many slots as the highest number of meetings any one person has.
+    Input:
+        pairs: {(mentor, company) ...}
+        slots: the number of slots available in the bucket
+    Output:
+        {(mentor, company): slot ...}, or None if someone has more meetings than slots
+    '''
+    degrees = {}
+    for (mentor, company) in pairs:
+        degrees[("m", mentor)] = degrees.get(("m", mentor), 0) + 1
+        degrees[("c", company)] = degrees.get(("c", company), 0) + 1
+    if any(degree > slots for degree in degrees.values()):
+        return None
+
+    # slot -> other end of the edge, for each mentor and company
+    mentor_slots = {}
+    company_slots = {}
+
+    def free_slot(used):
+        for slot in range(slots):
+            if slot not in used:
+                return slot
+        return None
+
+    for (mentor, company) in pairs:
+        m_used = mentor_slots.setdefault(mentor, {})
+        c_used = company_slots.setdefault(company, {})
+        a = free_slot(m_used)
+        b = free_slot(c_used)
+
+        if a in c_used:
+            # Walk the path of edges alternating between slots a and b starting from the
+            # company, then swap the two slots along it. The path can never reach the
+            # mentor since the graph is bipartite, so afterwards a is free at both ends.
+            path = []
+            node, slot, at_company = company, a, True
+            while True:
+                used = company_slots[node] if at_company else mentor_slots[node]
+                if slot not in used:
+                    break
+                other = used[slot]
+                path.append((other, node, slot) if at_company else (node, other, slot))
+                node, slot, at_company = other, (b if slot == a else a), not at_company
+            for (m, c, slot) in path:
+                del mentor_slots[m][slot]
+                del company_slots[c][slot]
+            for (m, c, slot) in path:
+                swapped = b if slot == a else a
+                mentor_slots[m][swapped] = c
+                company_slots[c][swapped] = m
+
+        m_used[a] = company
+        c_used[a] = mentor
+
+    return {(mentor, company): slot for mentor in mentor_slots
+        for (slot, company) in mentor_slots[mentor].items()}
+
 def step_1(matrix):
     '''
-    Steps through the proto-schedule, assigning times to each mentor/company pair,
-    checking for collisions at every step.
+    Steps through the proto-schedule, grouping the meetings by (day, time) and assigning
+    a slot to each mentor/company pair within each group.
     Input:
         matrix: {(mentor, company, (day, time)) ...}
     output:
         The previous but with numerical times {(mentor, company, (day, time)) ...},
             or None if no valid schedule is found
     '''
-
-    # Turn AM/PM and an offset to an actual time
-    def deterministic_time(time, i):
-        if time == "AM":
-            return (9 + int(i/3), i%3*20)
-        else:
-            return (12 + int(i/3), i%3*20)
-
-    for _ in range(len(matrix)**2*2):
-        schedule = set()
-        matrix = list(matrix)
-        shuffle(matrix)
-        for (mentor, company, (day, time)) in matrix:
-            for j in range(8):
-                new_time = deterministic_time(time, j)
-                schedule.add((mentor, company, (day, new_time)))
-                if not is_valid(schedule):
-                    schedule.remove((mentor, company, (day, new_time)))
-                    continue
-                else:
-                    break
-
-        if is_valid(schedule):
-            return schedule
-
-    return None
+    buckets = {}
+    for (mentor, company, (day, time)) in matrix:
+        if (day, time) not in buckets:
+            buckets[(day, time)] = set()
+        buckets[(day, time)].add((mentor, company))
+
+    schedule = set()
+    for (day, time) in buckets:
+        slots = assign_slots(buckets[(day, time)])
+        if slots is None:
+            return None
+        for ((mentor, company), slot) in slots.items():
+            schedule.add((mentor, company, (day, deterministic_time(time, slot))))
+
+    return schedule
 
 # Returns a set of (mentor, company, (day, time)) or None for the unscheduled mentors
 def step_2(unassigned, m_to_c, proto_schedule):
     '''
-    Randomly assigns dates and times to the unscheduled mentors, adding the results to
-    the existing schedule and ensuring that is valid each step of the way
+    Randomly assigns dates and times to the unscheduled mentors, then slots them together
+    with the already-booked mentors, retrying with new dates and times on failure
     Inputs:
         unassigned: {mentor ...}
-        m_to_c: {mentor: [company ...] ...}
-        proto_schedule: {(mentor, company, (day, time)) ...}
+        m_to_c: {(mentor, company) ...}
+        proto_schedule: {(mentor, company, (day, "AM"/"PM")) ...}
     '''
 
     def random_assignment():
@@ -125,38 +189,19 @@ def step_2(unassigned, m_to_c, proto_schedule):
     def random_day():
         return randint(1,5)
 
-    def deterministic_time(time, i):
-        if time == "AM":
-            return (9 + int(i/3), i%3*20)
-        else:
-            return (12 + int(i/3), i%3*20)
-
-    for _ in range(len(unassigned)**2*2):
+    for _ in range(max(1, len(unassigned)**2*2)):
 
         times = {}
         for mentor in unassigned:
             times[mentor] = (random_day(), random_assignment())
 
-        assignments = set()
+        matrix = set(proto_schedule)
         for (mentor, company) in m_to_c:
-            def run_simulation():
-                for j in range(9):
-                    entry = (mentor, company, (times[mentor][0],
-                        deterministic_time(times[mentor][1], j)))
-                    assignments.add(entry)
-                    if not is_valid(assignments.union(proto_schedule)):
-                        if j < 8:
-                            assignments.remove(entry)
-                            continue
-                        return False
-                    return True
-            if run_simulation():
-                continue
-            break
+            matrix.add((mentor, company, times[mentor]))
 
-        if is_valid(assignments.union(proto_schedule)):
-            return assignments.union(proto_schedule)
-        continue
+        schedule = step_1(matrix)
+        if schedule is not None:
+            return schedule
 
     return None
 
@@ -246,7 +291,7 @@ class UIWidget(QWidget):
             print("No solution found")
             sys.exit(0)
 
-        part_2 = step_2(unassigned, unassigned_schedule, part_1)
+        part_2 = step_2(unassigned, unassigned_schedule, assigned_schedule)
         if part_2 is None:
             print("No solution found")
             sys.exit(0)